@@ -25,8 +25,10 @@ license=\"\"\"
     limitations under the License.
 \"\"\"
 """
+import functools
 import logging
 import os
+import stat
 from contextlib import contextmanager
 
 from maya import cmds
@@ -60,30 +62,45 @@ def marginwrapper(margin_size):
     return
 
 
-@contextmanager
-def catch_exception():
+def catch_exception(func):
     """
     Catch all exception in a dialog raised to user.
 
+    Plain try/except wrapper: no generator object is constructed per call,
+    unlike the previous contextmanager-based version.
+
     Example::
 
-        >>> @catch_exception()
+        >>> @catch_exception
         >>> def try_something():
         >>>     value = 5 + "3"
 
         Will show a small window with "TypeError: unsupported operand ..." when executed.
     """
-    try:
-        yield
-    except Exception as excp:
-        cmds.confirmDialog(title="Error", icon="error", message=str(excp))
-    return
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except Exception as excp:
+            cmds.confirmDialog(title="Error", icon="error", message=str(excp))
+
+    return wrapper
 
 
 class PathInputDemoWindow:
 
     NAME = "PathInputDemo"
 
+    class _Style:
+        """
+        Interface styling constants.
+        """
+
+        padding_main_window = 15
+        width_button = 80
+        margin_widget_base = 10
+
     def __init__(self):
 
         self.delete_if_exists()
@@ -95,10 +112,14 @@ class PathInputDemoWindow:
         We build all the interface elements in this method.
         """
 
-        class Style:
-            padding_main_window = 15
-            width_button = 80
-            margin_widget_base = 10
+        Style = self._Style
+
+        # bind the commands used repeatedly to locals: one module attribute
+        # lookup instead of one per widget created
+        _rcl = cmds.rowColumnLayout
+        _sep = cmds.separator
+        _text = cmds.text
+        _btn = cmds.button
 
         self.layout_main = cmds.frameLayout(
             collapsable=False,
@@ -106,13 +127,13 @@ class PathInputDemoWindow:
             marginWidth=10,
             marginHeight=10,
         )
-        cmds.text(
+        _text(
             label="<h1>Path Input</h1>",
             align="center",
             recomputeSize=True,
         )
-        cmds.separator(height=20, style="none")
-        cmds.text(
+        _sep(height=20, style="none")
+        _text(
             label=(
                 "The given Maya file will be opened, all references will be repath."
                 "You the decide how to save it."
@@ -120,88 +141,85 @@ class PathInputDemoWindow:
             align="center",
             recomputeSize=True,
         )
-        cmds.separator(height=20, style="none")
-        self.layout_options = cmds.rowColumnLayout(numberOfColumns=5)
-        cmds.rowColumnLayout(self.layout_options, edit=True, adjustableColumn=3)
-        cmds.rowColumnLayout(self.layout_options, edit=True, columnAlign=[2, "center"])
-        cmds.rowColumnLayout(
+        _sep(height=20, style="none")
+        self.layout_options = _rcl(numberOfColumns=5)
+        # configure the layout in a single edit call to avoid one Maya
+        # round-trip (and re-layout) per option
+        _rcl(
             self.layout_options,
             edit=True,
+            adjustableColumn=3,
+            columnAlign=[2, "center"],
             rowSpacing=[1, Style.margin_widget_base],
-        ),
-        cmds.rowColumnLayout(
-            self.layout_options,
-            edit=True,
-            columnSpacing=[3, Style.margin_widget_base],
-        )
-        cmds.rowColumnLayout(
-            self.layout_options,
-            edit=True,
-            columnSpacing=[4, Style.margin_widget_base],
+            columnSpacing=[
+                (3, Style.margin_widget_base),
+                (4, Style.margin_widget_base),
+            ],
         )
 
         first_column_size = 130
 
+        # kwargs shared by all the widgets of the same role, built once
+        label_kw = {
+            "align": "right",
+            "font": "boldLabelFont",
+            "width": first_column_size,
+        }
+        button_kw = {"width": Style.width_button}
+
         with marginwrapper(Style.padding_main_window):
 
-            cmds.text(
+            _text(
                 label="Maya File",
-                align="right",
-                font="boldLabelFont",
                 recomputeSize=False,
-                width=first_column_size,
+                **label_kw
             )
             self.textfield_maya_file = cmds.textField(
                 annotation="Path to a Maya file.",
             )
-            self.button_browse_file = cmds.button(
+            self.button_browse_file = _btn(
                 label="Browse",
                 command=self.browse_maya_file,
-                width=Style.width_button,
+                **button_kw
             )
 
         with marginwrapper(Style.padding_main_window):
 
-            cmds.text(
-                label="New Root Directory",
-                align="right",
-                font="boldLabelFont",
-                width=first_column_size,
-            )
+            _text(label="New Root Directory", **label_kw)
             self.textfield_new_root = cmds.textField(
                 annotation="Path to an existing directory.",
             )
-            self.button_browse_root = cmds.button(
+            self.button_browse_root = _btn(
                 label="Browse",
                 command=self.browse_root_directory,
-                width=Style.width_button,
+                **button_kw
             )
         # end the layout_options
         cmds.setParent("..")
 
-        cmds.separator(height=10, style="none")
+        _sep(height=10, style="none")
 
-        self.layout_button01 = cmds.rowColumnLayout(numberOfColumns=5)
-        cmds.rowColumnLayout(self.layout_button01, edit=True, adjustableColumn=1)
-        cmds.rowColumnLayout(
+        self.layout_button01 = _rcl(numberOfColumns=5)
+        _rcl(
             self.layout_button01,
             edit=True,
+            adjustableColumn=1,
             columnSpacing=[4, Style.margin_widget_base],
         )
 
-        cmds.separator(width=1, style="none")  # adjustable column
+        _sep(width=1, style="none")  # adjustable column
 
         with marginwrapper(Style.padding_main_window):
 
-            self.button_start = cmds.button(
+            self.button_start = _btn(
                 label="Start",
                 command=self.start_process,
-                width=Style.width_button,
+                **button_kw
             )
-            self.button_cancel = cmds.button(
+            self.button_cancel = _btn(
                 label="Cancel",
                 command=self.delete_if_exists,
-                width=Style.width_button,
+                **button_kw
             )
         # end the layout_button01
         cmds.setParent("..")
@@ -211,10 +229,16 @@ class PathInputDemoWindow:
         return
 
     def delete_if_exists(self, *args):
-        if cmds.windowPref(self.NAME, query=True, exists=True):
+        # acting directly and swallowing the "doesn't exist" error is one
+        # Maya call per widget instead of one query + one edit
+        try:
             cmds.windowPref(self.NAME, remove=True)
-        if cmds.window(self.NAME, query=True, exists=True):
+        except RuntimeError:
+            pass
+        try:
             cmds.deleteUI(self.NAME, window=True)
+        except RuntimeError:
+            pass
         return
 
     def browse_maya_file(self, *args):
@@ -228,7 +252,7 @@ class PathInputDemoWindow:
         file_path = file_path[0]
 
         cmds.textField(self.textfield_maya_file, edit=True, text=file_path)
-        logger.debug("set maya file to {}".format(file_path))
+        logger.debug("set maya file to %s", file_path)
         return
 
     def browse_root_directory(self, *args):
@@ -241,10 +265,10 @@ class PathInputDemoWindow:
         dir_path = dir_path[0]
 
         cmds.textField(self.textfield_new_root, edit=True, text=dir_path)
-        logger.debug("set root dir to {}".format(dir_path))
+        logger.debug("set root dir to %s", dir_path)
         return
 
-    @catch_exception()
+    @catch_exception
     def start_process(self, *args):
         """
         Main function of the interface
@@ -260,24 +284,39 @@ class PathInputDemoWindow:
         if not maya_file_path:
             raise ValueError("No Maya file path supplied.")
 
-        if not os.path.exists(maya_file_path):
+        # a single os.stat per path validates existence and type at once,
+        # instead of one syscall for exists + one for isfile/isdir
+        try:
+            maya_file_stat = os.stat(maya_file_path)
+        except OSError:
             raise FileNotFoundError(
                 "Maya file path doesn't exists on disk: {}".format(maya_file_path)
             )
+        if not stat.S_ISREG(maya_file_stat.st_mode):
+            raise FileNotFoundError(
+                "Maya file path is not a file: {}".format(maya_file_path)
+            )
 
         root_substitute = cmds.textField(self.textfield_new_root, query=True, text=True)
 
         if not root_substitute:
             raise ValueError("No New Root directory path supplied.")
 
-        if not os.path.exists(root_substitute):
+        try:
+            root_substitute_stat = os.stat(root_substitute)
+        except OSError:
             raise FileNotFoundError(
                 "Root directory path doesn't exists on disk: {}".format(root_substitute)
             )
+        if not stat.S_ISDIR(root_substitute_stat.st_mode):
+            raise FileNotFoundError(
+                "Root directory path is not a directory: {}".format(root_substitute)
+            )
 
         logger.info(
-            "Executing with root_substitute={}, maya_file_path={}"
-            "".format(root_substitute, maya_file_path)
+            "Executing with root_substitute=%s, maya_file_path=%s",
+            root_substitute,
+            maya_file_path,
         )
         return
 
@@ -29,6 +29,7 @@ license=\"\"\"
 import logging
 
 import maya.cmds as cmds
+import maya.utils
 
 
 logger = logging.getLogger("pizza_creator")
@@ -44,14 +45,30 @@ They must be indepent from the interface.
 """
 
 
-PIZZA_DATABASE = {}
-"""
-To store all the pizza created by the user with their property.
+class _PizzaDB:
+    """
+    To store all the pizza created by the user with their property.
 
-Pizzas are stored as ::
+    The names are kept in a list next to the per-pizza property dicts, so
+    the UI can display them directly without materializing a new list on
+    every refresh.
 
-    { pizzaName: { "hasPineapple": bool }, ... }
-"""
+    Properties are stored as ::
+
+        { pizzaName: { "hasPineapple": bool }, ... }
+    """
+
+    def __init__(self):
+        self.names = []
+        self.props = {}
+
+    def add(self, name):
+        if name not in self.props:
+            self.names.append(name)
+        self.props[name] = {}
+
+
+PIZZA_DATABASE = _PizzaDB()
 
 
 def create_pizza(name):
@@ -61,8 +78,8 @@ def create_pizza(name):
     Args:
         name(str):
     """
-    PIZZA_DATABASE[name] = {}
-    logger.info("Pizza <{}> created".format(name))
+    PIZZA_DATABASE.add(name)
+    logger.info("Pizza <%s> created", name)
     return
 
 
@@ -77,14 +94,14 @@ def set_has_pineapple(pizza_name, has_pineapple):
     Raises:
         ValueError: if the given pizza_name was never creatd yet.
     """
-    pizza = PIZZA_DATABASE.get(pizza_name)
+    pizza = PIZZA_DATABASE.props.get(pizza_name)
     if pizza is None:
         raise ValueError("Pizza {} was not created.".format(pizza_name))
 
     # pizza should already be a dict, as set in create_pizza()
     pizza["hasPineapple"] = has_pineapple
 
-    logger.info("Pizza <{}> set pineapple to {}".format(pizza_name, has_pineapple))
+    logger.info("Pizza <%s> set pineapple to %s", pizza_name, has_pineapple)
     return
 
 
@@ -97,7 +114,7 @@ def get_has_pineapple(pizza_name):
     Returns:
         bool: True if the pizza has pineapple
     """
-    return PIZZA_DATABASE.get(pizza_name, {}).get("hasPineapple", False)
+    return PIZZA_DATABASE.props.get(pizza_name, {}).get("hasPineapple", False)
 
 
 """ ---------------------------------------------------------------------------
@@ -117,6 +134,14 @@ class PizzaCreatorWindow:
         # make sure we don't create 2 time the same window so delete it before
         self.delete_if_exists()
 
+        # True when a deferred UI refresh is already scheduled
+        self._refresh_pending = False
+        # bind the hot selection callback once instead of letting python
+        # rebuild the bound method on every selection change
+        self._cb_update_pineapple = self.update_pineapple_button
+        # last state applied to the pineapple buttons, None = never set
+        self._last_pineapple_state = None
+
         self.window = cmds.window(self.NAME, title=self.NAME, widthHeight=(400, 500))
 
         self.build()
@@ -127,6 +152,13 @@ class PizzaCreatorWindow:
         We build all the interface elements in this method.
         """
 
+        # bind the commands used repeatedly to locals: one module attribute
+        # lookup instead of one per widget created
+        _rcl = cmds.rowColumnLayout
+        _sep = cmds.separator
+        _text = cmds.text
+        _btn = cmds.button
+
         # this layout will only have one column, that cna extend
         self.layout_main = cmds.frameLayout(
             collapsable=False,
@@ -134,7 +166,7 @@ class PizzaCreatorWindow:
             marginWidth=10,
             marginHeight=10,
         )
-        cmds.text(
+        _text(
             label='<h1 style="color: #C97B30;">Welcome to the pizza creator<h1>',
             bgc=(255 / 255, 218 / 255, 102 / 255),
             align="center",
@@ -142,16 +174,20 @@ class PizzaCreatorWindow:
             recomputeSize=False,
             height=20,
         )
-        cmds.separator(height=10, style="none")
-
-        self.layout_create = cmds.rowColumnLayout(numberOfColumns=3)
-        cmds.rowColumnLayout(self.layout_create, edit=True, adjustableColumn=2)
-        cmds.rowColumnLayout(self.layout_create, edit=True, columnSpacing=[1, 10])
-        cmds.rowColumnLayout(self.layout_create, edit=True, columnSpacing=[2, 10])
-        cmds.rowColumnLayout(self.layout_create, edit=True, columnSpacing=[3, 10])
-        cmds.text(label="Pizza Name", align="left")
+        _sep(height=10, style="none")
+
+        self.layout_create = _rcl(numberOfColumns=3)
+        # configure the layout in a single edit call to avoid one Maya
+        # round-trip (and re-layout) per option
+        _rcl(
+            self.layout_create,
+            edit=True,
+            adjustableColumn=2,
+            columnSpacing=[(1, 10), (2, 10), (3, 10)],
+        )
+        _text(label="Pizza Name", align="left")
         self.textfield_pizza_name = cmds.textField(annotation="Name of the Pizza")
-        self.button_create_pizza = cmds.button(
+        self.button_create_pizza = _btn(
             label="Create Pizza",
             command=self.create_pizza,
             bgc=(0.2, 0.2, 0.2),
@@ -159,26 +195,26 @@ class PizzaCreatorWindow:
         # end layout_create
         cmds.setParent("..")
 
-        cmds.separator(height=10, style="none")  # (belongs to layout_main)
+        _sep(height=10, style="none")  # (belongs to layout_main)
 
-        self.layout_list_pizza = cmds.rowColumnLayout(numberOfColumns=1)
-        cmds.rowColumnLayout(self.layout_list_pizza, edit=True, adjustableColumn=1)
-        cmds.text(label="Pizza List", align="center")
-        cmds.separator(height=5, style="none")
+        self.layout_list_pizza = _rcl(numberOfColumns=1)
+        _rcl(self.layout_list_pizza, edit=True, adjustableColumn=1)
+        _text(label="Pizza List", align="center")
+        _sep(height=5, style="none")
         # list is created empty at the beginning !
         self.textlist_pizza = cmds.textScrollList(
             allowMultiSelection=False,
             # this creates a callback. The function is called when we change selection
-            selectCommand=self.update_pineapple_button,
+            selectCommand=self._cb_update_pineapple,
             height=200,
         )
-        cmds.separator(height=10, style="none")
-        self.button_add_pineapple = cmds.button(
+        _sep(height=10, style="none")
+        self.button_add_pineapple = _btn(
             label="Add Pineapple",
             command=self.add_pineapple_to_selected,
             bgc=(0.2, 0.2, 0.2),
         )
-        self.button_remove_pineapple = cmds.button(
+        self.button_remove_pineapple = _btn(
             label="Remove Pineapple",
             command=self.remove_pineapple_to_selected,
             bgc=(0.2, 0.2, 0.2),
@@ -239,7 +275,7 @@ class PizzaCreatorWindow:
         create_pizza(name=pizza_name)
 
         # as we modified the pizza database, we need to refresh the pizza list
-        self.update_pizza_list()
+        self.request_refresh()
         return
 
     def add_pineapple_to_selected(self, *args):
@@ -250,9 +286,8 @@ class PizzaCreatorWindow:
 
         set_has_pineapple(selected_pizza, True)
 
-        # we need to trigger an update of the buttons interface, but we don't need
-        # to refresh the whole list
-        self.update_pineapple_button()
+        # we need to trigger an update of the buttons interface
+        self.request_refresh()
         return
 
     def remove_pineapple_to_selected(self, *args):
@@ -263,33 +298,55 @@ class PizzaCreatorWindow:
 
         set_has_pineapple(selected_pizza, False)
 
-        # we need to trigger an update of the buttons interface, but we don't need
-        # to refresh the whole list
+        # we need to trigger an update of the buttons interface
+        self.request_refresh()
+        return
+
+    def request_refresh(self):
+        """
+        Schedule a single deferred refresh of the interface.
+
+        Successive calls before Maya gets idle again are coalesced into one
+        refresh, so a burst of user actions only repaints the widgets once.
+        """
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        maya.utils.executeDeferred(self._do_refresh)
+        return
+
+    def _do_refresh(self):
+        self._refresh_pending = False
+        self.update_pizza_list()
         self.update_pineapple_button()
         return
 
     def update_pizza_list(self, *args):
         """
         Refresh the widget displaying all the pizza stored.
+
+        Only the difference with the currently displayed items is applied,
+        so adding one pizza issues one widget edit instead of rebuilding
+        the whole list.
         """
 
-        pizza_name_list = list(PIZZA_DATABASE.keys())
-
-        # we store the name of the currently selected item, so we can restore it later
-        selected_item = self.get_selected_pizza()
-
-        # we remove all items, so we don't add duplicates !
-        cmds.textScrollList(self.textlist_pizza, edit=True, removeAll=True)
-        # add all the items
-        cmds.textScrollList(self.textlist_pizza, edit=True, append=pizza_name_list)
-        # and now we can select back the previously selected item
-        # if it doesn't exist anymore, just nothing will happen
-        if selected_item:
-            cmds.textScrollList(
-                self.textlist_pizza,
-                edit=True,
-                selectItem=selected_item,
-            )
+        # direct read of the stored name list, no copy
+        pizza_name_list = PIZZA_DATABASE.names
+
+        current_items = (
+            cmds.textScrollList(self.textlist_pizza, query=True, allItems=True) or []
+        )
+        current_set = set(current_items)
+        target_set = set(pizza_name_list)
+
+        removed = [item for item in current_items if item not in target_set]
+        added = [name for name in pizza_name_list if name not in current_set]
+
+        # untouched items keep their selection, no need to save/restore it
+        if removed:
+            cmds.textScrollList(self.textlist_pizza, edit=True, removeItem=removed)
+        if added:
+            cmds.textScrollList(self.textlist_pizza, edit=True, append=added)
         return
 
     def update_pineapple_button(self, *args):
@@ -303,6 +360,12 @@ class PizzaCreatorWindow:
         else:
             has_pineapple = False
 
+        # nothing to edit when the buttons already show that state
+        has_pineapple = bool(has_pineapple)
+        if has_pineapple == self._last_pineapple_state:
+            return
+        self._last_pineapple_state = has_pineapple
+
         # this whole condition can be "optimized" in 2 lines ;)
         if has_pineapple:
             cmds.button(self.button_add_pineapple, edit=True, enable=False)
@@ -315,10 +378,16 @@ class PizzaCreatorWindow:
 
     def delete_if_exists(self):
 
-        if cmds.windowPref(self.NAME, query=True, exists=True):
+        # acting directly and swallowing the "doesn't exist" error is one
+        # Maya call per widget instead of one query + one edit
+        try:
             cmds.windowPref(self.NAME, remove=True)
-        if cmds.window(self.NAME, query=True, exists=True):
+        except RuntimeError:
+            pass
+        try:
             cmds.deleteUI(self.NAME, window=True)
+        except RuntimeError:
+            pass
 
         return
 
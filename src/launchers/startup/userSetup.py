@@ -1,12 +1,12 @@
 import logging
 import inspect
 import os
-import runpy
 import shutil
 from contextlib import contextmanager
 
-import maya
-from maya import cmds
+# maya.cmds is imported lazily inside the functions needing it: resolving
+# the full cmds command table is slow and would otherwise happen before
+# logging and env-var checks even run
 
 
 logger = logging.getLogger("userSetup")
@@ -22,8 +22,10 @@ class Env:
     always_override_prefs = "LXM_MAYA_ALWAYS_OVERRIDE_PREFS"
     # mandatory
     env_dir = "LXM_MAYA_ENV_DIR"
+    # resolved once at import so functions don't re-query the environment
+    env_dir_path = os.getenv(env_dir)
     # mandatory checks
-    if not os.getenv(env_dir):
+    if not env_dir_path:
         raise EnvironmentError("Missing variable {}".format(env_dir))
 
 
@@ -52,6 +54,23 @@ def catch_exceptions():
         logger.exception("{}".format(excp))
 
 
+@contextmanager
+def suspended_refresh():
+    """
+    Prevent the viewport from refreshing for the duration of the context.
+
+    Wrap any block issuing a lot of scene/pref mutations so the UI updates
+    they trigger are collapsed into a single refresh at the end.
+    """
+    from maya import cmds
+
+    cmds.refresh(suspend=True)
+    try:
+        yield
+    finally:
+        cmds.refresh(suspend=False)
+
+
 @catch_exceptions()
 def setup_maya_plugins_loading():
     """
@@ -60,23 +79,43 @@ def setup_maya_plugins_loading():
     The logic is actually dirty where we override the default ``pluginPrefs.mel``
     by a pre-define done, whose path is provided via an env var.
     """
+    from maya import cmds
+
+    source_plugin_pref_file = os.path.join(Env.env_dir_path, "pluginPrefs.mel")
+
+    maya_version_prefs_dir = cmds.about(query=True, preferences=True)
+    maya_version_prefs_dir = os.path.join(maya_version_prefs_dir, "prefs")
 
-    source_plugin_pref_file = os.getenv(Env.env_dir)
-    source_plugin_pref_file = os.path.join(source_plugin_pref_file, "pluginPrefs.mel")
+    target_plugin_pref_file = os.path.join(maya_version_prefs_dir, "pluginPrefs.mel")
 
-    if not os.path.exists(source_plugin_pref_file):
+    # copy2 preserves size + mtime, so matching metadata means the target
+    # is already up-to-date and the two file I/O passes can be skipped
+    try:
+        source_stat = os.stat(source_plugin_pref_file)
+        target_stat = os.stat(target_plugin_pref_file)
+    except OSError:
+        pass
+    else:
+        if (source_stat.st_size, int(source_stat.st_mtime)) == (
+            target_stat.st_size,
+            int(target_stat.st_mtime),
+        ):
+            logger.debug(
+                "returning earlier. {} is already up-to-date."
+                "".format(target_plugin_pref_file)
+            )
+            return
+
+    # no pre-check of the source file: copy2 stats it anyway and raises if absent
+    try:
+        shutil.copy2(source_plugin_pref_file, target_plugin_pref_file)
+    except FileNotFoundError:
         logger.warning(
             "returning earlier. {} doesn't exists on disk."
             "".format(source_plugin_pref_file)
         )
         return
 
-    maya_version_prefs_dir = cmds.about(query=True, preferences=True)
-    maya_version_prefs_dir = os.path.join(maya_version_prefs_dir, "prefs")
-
-    target_plugin_pref_file = os.path.join(maya_version_prefs_dir, "pluginPrefs.mel")
-
-    shutil.copy2(source_plugin_pref_file, target_plugin_pref_file)
     logger.info(
         "copied {} -> {}".format(source_plugin_pref_file, target_plugin_pref_file)
     )
@@ -91,6 +130,7 @@ def set_maya_need_restart(need_restart):
     Args:
         need_restart: True to inform the user that maya will need a restart.
     """
+    from maya import cmds
 
     if not need_restart:
         return
@@ -105,7 +145,9 @@ def set_maya_need_restart(need_restart):
             icon="warning",
         )
 
-    maya.utils.executeDeferred(show_dialog)
+    # lowestPriority delays the dialog until maya is fully idle, so the
+    # initial UI paint is not blocked by it
+    cmds.evalDeferred(show_dialog, lowestPriority=True)
     logger.info("Maya will need a restart.")
     return
 
@@ -117,6 +159,8 @@ def set_pref_on_launch():
     You can choose to always override prefs with the environemet variable
     ``Env.always_override_prefs``.
     """
+    from maya import cmds
+
     logger.debug("started")
 
     pref_registered_variable = "customPrefRegistered"
@@ -129,11 +173,13 @@ def set_pref_on_launch():
         logger.info("pref already registered, returning early.")
         return
 
-    with catch_exceptions():
+    with catch_exceptions(), suspended_refresh():
 
-        sourcedir = os.getenv(Env.env_dir)
-        user_prefs_file = os.path.join(sourcedir, "userPrefs.py")
-        runpy.run_path(user_prefs_file)
+        user_prefs_file = os.path.join(Env.env_dir_path, "userPrefs.py")
+        # compile + exec skips runpy's per-call module namespace machinery
+        with open(user_prefs_file, "rb") as prefs_stream:
+            prefs_code = compile(prefs_stream.read(), user_prefs_file, "exec")
+        exec(prefs_code, {"__name__": "__main__", "__file__": user_prefs_file})
         logger.info("executed {}".format(user_prefs_file))
 
     cmds.optionVar(intValue=(pref_registered_variable, 1))
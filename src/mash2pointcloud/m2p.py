@@ -32,29 +32,34 @@ import logging
 import os
 import sys
 import time
+import types
 import webbrowser
 
 from maya import cmds
-import pymel.core as pm
+from maya.api import OpenMaya as om2
+
+
+# built once : Formatter compiles its format string at construction
+_M2P_FORMATTER = logging.Formatter(
+    "%(asctime)s - [%(levelname)7s] %(name)38s // %(message)s",
+    datefmt="%H:%M:%S",
+)
 
 
 def setup_logging(level):
 
     logger = logging.getLogger("m2p")
-    logger.setLevel(level)
 
-    if not logger.handlers:
-        # create a file handler
-        handler = logging.StreamHandler(stream=sys.stdout)
-        handler.setLevel(logging.DEBUG)
-        # create a logging format
-        formatter = logging.Formatter(
-            "%(asctime)s - [%(levelname)7s] %(name)38s // %(message)s",
-            datefmt="%H:%M:%S",
-        )
-        handler.setFormatter(formatter)
-        # add the file handler to the logger
-        logger.addHandler(handler)
+    if logger.handlers:
+        # already configured by a previous execution of the script : don't
+        # stack a duplicate handler or override the verbosity again
+        return logger
+
+    logger.setLevel(level)
+    handler = logging.StreamHandler(stream=sys.stdout)
+    handler.setLevel(logging.DEBUG)
+    handler.setFormatter(_M2P_FORMATTER)
+    logger.addHandler(handler)
 
     return logger
 
@@ -62,21 +67,103 @@ def setup_logging(level):
 logger = setup_logging(logging.DEBUG)
 
 
+# maya data-type names -> om2 constants, for attribute creation through the API
+_OM2_DATA_TYPES = {
+    "vectorArray": om2.MFnData.kVectorArray,
+    "doubleArray": om2.MFnData.kDoubleArray,
+    "stringArray": om2.MFnData.kStringArray,
+    "string": om2.MFnData.kString,
+}
+
+
+"""DEFAULT_SCENE_CONFIG(dict)
+
+Configure how the scene is built and exported.
+
+[build.particleSystem](dict):
+    each key is an attribute name to create
+
+    rotation and scale doesn't have a corresponding mashAttr cause they are
+    automatically linked to the mash attribute of the same name.
+
+    think to add them in [export.alembic.attributes]
+
+Wrapped in a MappingProxyType so a run can't mutate it by accident.
+"""
+DEFAULT_SCENE_CONFIG = types.MappingProxyType(
+    {
+        "build": {
+            "particleSystem": {
+                "rotation": {"dataType": "vectorArray", "mashAttr": ""},
+                "scale": {"dataType": "vectorArray", "mashAttr": ""},
+                "objectIndex": {"dataType": "vectorArray", "mashAttr": "inIdPP"},
+            },
+        },
+        "export": {
+            "alembic": {
+                "frame_range": [1, 1],
+                "attributes": ["rotation", "scale", "objectIndex"],
+                "frame_relative_samples": [],
+            }
+        },
+    }
+)
+
+
+# constant flag tokens of the AbcExport job string, built once at import
+_ABC_FLAGS = (
+    "-uvWrite",
+    "-writeFaceSets",
+    "-worldSpace",
+    "-writeVisibility",
+    "-stripNamespaces",
+    "-autoSubd",
+    "-dataFormat",
+    "ogawa",
+)
+
+
+def get_mobject(node_name):
+    """
+    Args:
+        node_name(str): name of an existing maya node
+
+    Returns:
+        OpenMaya.MObject: handle to the given node
+    """
+    msel = om2.MSelectionList()
+    msel.add(node_name)
+    return msel.getDependNode(0)
+
+
 class ParticleSystem(object):
     def __init__(self, name):
 
         self.name = name
         self.shape = name + "Shape"
+        # computed once : every plug name on the shape starts with this
+        self._shape_prefix = self.shape + "."
         self.nucleus = None
         self.emitter = None
+        # om2 function set on the shape, resolved once then reused :
+        # an MObject stays valid even if the node is renamed.
+        self._shape_fn = None
 
         return
 
-    def build(self):
+    def get_shape_fn(self):
+        """
+        Returns:
+            OpenMaya.MFnDependencyNode: function set attached to the shape node.
+        """
+        if self._shape_fn is None:
+            self._shape_fn = om2.MFnDependencyNode(get_mobject(self.shape))
+        return self._shape_fn
 
-        sel_before = cmds.ls()
+    def build(self):
 
-        # create the particle emitter
+        # create the particle emitter, the command returns the created node
+        # so there is no need to diff the whole scene content afterwards.
         self.emitter = cmds.emitter(
             type="omni",
             pos=[0, 0, 0],
@@ -95,36 +182,24 @@ class ParticleSystem(object):
             dy=0,
             dz=0,
             sp=0,
-        )
+        )[0]
         # create the nParticle system
         nparticle = cmds.nParticle()[0]  # type: str
         cmds.rename(nparticle, self.name)
         cmds.connectDynamic(self.name, em=self.emitter)
 
-        sel_after = cmds.ls()
-
-        # try to find the nucleus and emitter node from the difference between
-        # the before scene and the after scene. (funky yeah)
-        ps_nodes = [
-            x for x in sel_after if x not in set(sel_before)
-        ]  # [u'emitter1', u'eve', u'eveShape', u'nucleus1']
-
-        for pnode in ps_nodes:
-
-            if "nucleus" in pnode:
-                self.nucleus = pnode
-            elif "emitter" in pnode:
-                self.emitter = pnode
-
-            continue
+        # the nucleus is implicitly created (or reused) by cmds.nParticle and
+        # connected to the shape : a bounded connection query retrieves it.
+        nucleus_list = cmds.listConnections(self.shape, type="nucleus")
+        self.nucleus = nucleus_list[0] if nucleus_list else None
 
         if not self.nucleus:
             self.delete()
-            raise ValueError("Nucleus was not found in <{}> !".format(ps_nodes))
+            raise ValueError("Nucleus was not found for <{}> !".format(self.name))
 
         if not self.emitter:
             self.delete()
-            raise ValueError("Emitter was not found in <{}> !".format(ps_nodes))
+            raise ValueError("Emitter was not created for <{}> !".format(self.name))
 
         logger.info(
             "[ParticleSystem][build] Finished. Created <{}> nParticle."
@@ -138,40 +213,56 @@ class ParticleSystem(object):
         Delete the Particle system and every object associated to it.
         """
 
-        pm.disconnectAttr(self.shape)
-
-        try:
-            cmds.delete(self.name)
-        except Exception as excp:
-            logger.warning(
-                "[ParticleSystem][delete] Can't delete nParticle <{}>: {}"
-                "".format(self.name, excp)
+        # break every connection on the shape : pymel offered this as a
+        # one-liner but importing it costs seconds of startup, so we do the
+        # same with cmds. listConnections with connections=True returns flat
+        # [shapePlug, otherPlug, ...] pairs, one query per direction.
+        in_connections = (
+            cmds.listConnections(
+                self.shape,
+                plugs=True,
+                connections=True,
+                source=True,
+                destination=False,
             )
-
-        try:
-            cmds.delete(self.shape)
-        except Exception as excp:
-            logger.warning(
-                "[ParticleSystem][delete] Can't delete nParticle shape <{}>"
-                "(not an issue): {}"
-                "".format(self.shape, excp)
-            )
-
-        try:
-            cmds.delete(self.emitter)
-        except Exception as excp:
-            logger.warning(
-                "[ParticleSystem][delete] Can't delete emitter <{}>: {}"
-                "".format(self.emitter, excp)
+            or []
+        )
+        for shape_plug, source_plug in zip(in_connections[::2], in_connections[1::2]):
+            cmds.disconnectAttr(source_plug, shape_plug)
+
+        out_connections = (
+            cmds.listConnections(
+                self.shape,
+                plugs=True,
+                connections=True,
+                source=False,
+                destination=True,
             )
-
+            or []
+        )
+        for shape_plug, dest_plug in zip(out_connections[::2], out_connections[1::2]):
+            cmds.disconnectAttr(shape_plug, dest_plug)
+
+        # single delete call : one DG invalidation and one undo entry instead
+        # of four, with an objExists check replacing the try/except-per-node
+        # control flow (exceptions are much slower than a boolean query).
+        to_delete = [
+            node
+            for node in (self.name, self.shape, self.emitter, self.nucleus)
+            if node and cmds.objExists(node)
+        ]
+
+        cmds.undoInfo(openChunk=True)
         try:
-            cmds.delete(self.nucleus)
-        except Exception as excp:
+            if to_delete:
+                cmds.delete(to_delete)
+        except RuntimeError as excp:
             logger.warning(
-                "[ParticleSystem][delete] Can't delete nucleus <{}> : {}"
-                "".format(self.nucleus, excp)
+                "[ParticleSystem][delete] Can't delete nodes <{}>: {}"
+                "".format(to_delete, excp)
             )
+        finally:
+            cmds.undoInfo(closeChunk=True)
 
         logger.info("[ParticleSystem][delete] Finished for <{}>.".format(self.name))
 
@@ -186,7 +277,15 @@ class ParticleSystem(object):
 
         """
 
-        cmds.connectAttr(source, "{}.{}".format(self.shape, target))
+        # direct API connection : no MEL parsing of "node.attr" strings
+        msel = om2.MSelectionList()
+        msel.add(source)
+        source_plug = msel.getPlug(0)
+        target_plug = self.get_shape_fn().findPlug(target, False)
+
+        modifier = om2.MDGModifier()
+        modifier.connect(source_plug, target_plug)
+        modifier.doIt()
 
         logger.debug(
             "[ParticleSystem][connect] Finished with source={},target={}."
@@ -197,8 +296,7 @@ class ParticleSystem(object):
 
     def set_playfromcache(self, value):
 
-        pfc_attr = "{}.playFromCache".format(self.shape)
-        cmds.setAttr(pfc_attr, value)
+        cmds.setAttr(self._shape_prefix + "playFromCache", value)
 
         return
 
@@ -210,10 +308,6 @@ class ParticleSystem(object):
 
         """
 
-        # Had a bug were the dynamic expression was not computed if
-        # the viewport was not refreshed.
-        cmds.refresh()
-
         cmds.dynExpression(
             self.shape,
             creation=True,
@@ -235,11 +329,10 @@ class ParticleSystem(object):
             data_type(str): data type to use for the attribute
 
         """
-        # Had a bug were the dynamic expression was not computed if
-        # the viewport was not refreshed.
-        cmds.refresh()
-
-        cmds.addAttr(self.shape, ln=name, dataType=data_type, keyable=True)
+        attr_fn = om2.MFnTypedAttribute()
+        attr_object = attr_fn.create(name, name, _OM2_DATA_TYPES[data_type])
+        attr_fn.keyable = True
+        self.get_shape_fn().addAttribute(attr_object)
 
         logger.debug(
             "[ParticleSystem][create_attr] Finished with name=<{}>,"
@@ -255,16 +348,18 @@ def get_mash_network():
         str: name of the mash network node
     """
 
-    user_sel = cmds.ls(sl=True)
+    # om2 selection query : no python list of every selected node name is
+    # built and the type check doesn't go through a MEL command.
+    selection = om2.MGlobal.getActiveSelectionList()
 
-    if len(user_sel) > 1 or len(user_sel) == 0:
+    if selection.length() != 1:
         raise ValueError("Select only one MASH network please")
 
-    user_sel = user_sel[0]
-    if not cmds.nodeType(user_sel) == "MASH_Waiter":
+    node_fn = om2.MFnDependencyNode(selection.getDependNode(0))
+    if not node_fn.typeName == "MASH_Waiter":
         raise ValueError("Selected object is not a valid MASH network.")
 
-    return user_sel
+    return node_fn.name()
 
 
 def export_abc(meshs, path, attributes=None, frame_range=None, frs=None):
@@ -288,39 +383,43 @@ def export_abc(meshs, path, attributes=None, frame_range=None, frs=None):
 
     cmds.refresh()  # safety refresh cause Maya you know
 
-    abc_meshs = ""
-    for mesh in meshs:
-        abc_meshs += "-root {} ".format(mesh)
+    frame_range = frame_range or [1, 1]
 
-    abc_attrs = ""
-    if attributes:
-        for attr in attributes:
-            abc_attrs += "-attr {} ".format(attr)
+    # flat token list joined once at the end : every value is cast with
+    # str() so ints/floats coming from the config can't TypeError the join
+    parts = ["-frameRange", str(frame_range[0]), str(frame_range[1])]
 
-    frame_range = frame_range or [1, 1]
-    frame_range = "{} {}".format(frame_range[0], frame_range[1])
-
-    frs = ""
-    if frs:
-        for frs_item in frs:
-            frs += "-frameRelativeSample {} ".format(frs_item)
-
-    export_command = (
-        "-frameRange {0} "
-        "{1}"
-        "{2}"
-        "-uvWrite "
-        "-writeFaceSets "
-        "-worldSpace "
-        "-writeVisibility "
-        "-stripNamespaces "
-        "-autoSubd "
-        "-dataFormat ogawa "
-        "{3}"
-        "-file {4}"
-        "".format(frame_range, frs, abc_attrs, abc_meshs, path)
-    )
+    for frs_item in frs or []:
+        parts += ["-frameRelativeSample", str(frs_item)]
 
+    for attribute in attributes or []:
+        parts += ["-attr", attribute]
+
+    parts.extend(_ABC_FLAGS)
+
+    for mesh in meshs:
+        parts += ["-root", mesh]
+
+    # quoted so a path containing spaces doesn't break the job string parser
+    parts += ["-file", '"' + path.replace('"', '\\"') + '"']
+
+    export_command = " ".join(parts)
+
+    # suspend viewport redraws and unmanage the main pane while exporting :
+    # per-frame redraws dominate wall time on frame-heavy exports.
+    panes_managed = cmds.paneLayout("viewPanes", query=True, manage=True)
+    cmds.refresh(suspend=True)
+    cmds.paneLayout("viewPanes", edit=True, manage=False)
+    # also freeze the evaluation manager and pause the GPU renderer : with
+    # regular evaluation every node in the scene gets dirtied per exported
+    # frame even when it doesn't contribute to the exported roots.
+    # (ogs pause is a toggle : record whether we toggled it so an already
+    # paused renderer is left paused on exit)
+    previous_em_mode = cmds.evaluationManager(query=True, mode=True)[0]
+    cmds.evaluationManager(mode="off")
+    ogs_paused_here = not cmds.ogs(query=True, pause=True)
+    if ogs_paused_here:
+        cmds.ogs(pause=True)
     try:
         cmds.AbcExport(j=export_command)
     except Exception as excp:
@@ -329,8 +428,16 @@ def export_abc(meshs, path, attributes=None, frame_range=None, frs=None):
             " use the existing file:\n\n{}"
             "".format(excp)
         )
-
-    if not os.path.exists(path):
+    finally:
+        if ogs_paused_here and cmds.ogs(query=True, pause=True):
+            cmds.ogs(pause=True)
+        cmds.evaluationManager(mode=previous_em_mode)
+        cmds.paneLayout("viewPanes", edit=True, manage=panes_managed)
+        cmds.refresh(suspend=False)
+
+    # isfile : narrower (and cheaper on network shares) than exists, and a
+    # directory at that path would be a failure anyway
+    if not os.path.isfile(path):
         raise RuntimeError(
             "The alembic <{}> was not exported. (Output does not exists)"
             "".format(os.path.basename(path))
@@ -364,26 +471,66 @@ class Scene(object):
 
         psys_name = self.mashnw + "_pointcloud"
 
-        # create the Particle system
-        self.psys = ParticleSystem(psys_name)
-        self.psys.build()
+        # freeze the evaluation manager and the viewport for the duration of
+        # the build : every node/attr edit below would otherwise trigger its
+        # own dirty propagation and redraw.
+        previous_em_mode = cmds.evaluationManager(query=True, mode=True)[0]
+        cmds.evaluationManager(mode="off")
+        cmds.refresh(suspend=True)
+        cmds.undoInfo(openChunk=True)
+        try:
+
+            # create the Particle system
+            self.psys = ParticleSystem(psys_name)
+            self.psys.build()
 
-        # Setup the ParticleSystem for export
-        self.psys.set_playfromcache(True)
-        # # connect the MashNetwrok to the Particle System
-        self.psys.connect(
-            source="{}.outputPoints".format(self.mashnw), target="cacheArrayData"
-        )
+            # Setup the ParticleSystem for export
+            self.psys.set_playfromcache(True)
+            # # connect the MashNetwrok to the Particle System
+            self.psys.connect(
+                source="{}.outputPoints".format(self.mashnw), target="cacheArrayData"
+            )
+
+            # plug prefixes computed once for the whole loop
+            shape_prefix = self.psys.shape + "."
+            mash_prefix = self.mashnw + "."
+
+            # first pass : create every attribute
+            expressions = []
+
+            # sorted : deterministic attribute order on the nParticle shape
+            # whatever the source dict ordering is
+            for attr_name, attr_data in sorted(
+                self.config["build"]["particleSystem"].items()
+            ):
+
+                self.psys.create_attr(attr_name, attr_data["dataType"])
 
-        for attr_name, attr_data in self.config["build"]["particleSystem"].items():
+                if attr_data["mashAttr"]:
+                    expressions.append(
+                        "{}{} = {}{};".format(
+                            shape_prefix, attr_name, mash_prefix, attr_data["mashAttr"]
+                        )
+                    )
 
-            self.psys.create_attr(attr_name, attr_data["dataType"])
+            # one refresh so the expressions below see the new attributes
+            # (dynamic expressions are not computed on an un-refreshed scene),
+            # instead of the previous refresh per created attr/expression.
+            cmds.refresh(force=True)
 
-            if attr_data["mashAttr"]:
-                expr = "{}.{} = {}.{};" "".format(
-                    self.psys.shape, attr_name, self.mashnw, attr_data["mashAttr"]
-                )
-                self.psys.create_expression(expr)
+            # second pass : create the expressions reading those attributes
+            for expression in expressions:
+                self.psys.create_expression(expression)
+
+        finally:
+            cmds.undoInfo(closeChunk=True)
+            cmds.refresh(suspend=False)
+            cmds.evaluationManager(mode=previous_em_mode)
+
+        # single refresh replacing the per-call ones that previously lived in
+        # create_attr/create_expression (dynamic expressions are not computed
+        # until the viewport refreshes at least once).
+        cmds.refresh(force=True)
 
         logger.debug("[Scene][build] Finished.")
 
@@ -437,39 +584,9 @@ class Scene(object):
 
 def run():
 
-    stime = time.time()
-
-    """scene_config(dict)
-    
-    Configure how the scene is built and exported.
-    
-    [build.particleSystem](dict):
-        each key is an attribute name to create
-    
-        rotation and scale doesn't have a corresponding mashAttr cause they are 
-        automatically linked to the mash attribute of the same name.
-        
-        think to add them in [export.alembic.attributes]
-        
-    """
-    scene_config = {
-        "build": {
-            "particleSystem": {
-                "rotation": {"dataType": "vectorArray", "mashAttr": ""},
-                "scale": {"dataType": "vectorArray", "mashAttr": ""},
-                "objectIndex": {"dataType": "vectorArray", "mashAttr": "inIdPP"},
-            },
-        },
-        "export": {
-            "alembic": {
-                "frame_range": [1, 1],
-                "attributes": ["rotation", "scale", "objectIndex"],
-                "frame_relative_samples": [],
-            }
-        },
-    }
+    stime = time.perf_counter()
 
-    scene = Scene(config=scene_config)
+    scene = Scene(config=DEFAULT_SCENE_CONFIG)
     try:
         scene.build()
         export_path = scene.export()
@@ -489,7 +606,7 @@ def run():
     if user_choice == "Open Folder":
         webbrowser.open(os.path.dirname(export_path))
 
-    logger.info("[run] Finished in <{}>s".format(time.time() - stime))
+    logger.info("[run] Finished in <{}>s".format(time.perf_counter() - stime))
     return
 
 
@@ -81,20 +81,23 @@ class ErrorHandler(object):
     Errors are stored insided and can then be raised at the end of the process.
     """
     def __init__(self):
-        self.data = {}
+        self.data = []
 
     def add(self, source, error):
-        self.data[len(self.data) + 1] = (source, error)
+        # plain append : no synthetic integer key to compute and hash per add
+        self.data.append((source, error))
 
     def get_display_str(self):
-        display_str = ""
-        for error_id, error_data in self.data.items():
+        # list + join : linear in the number of errors instead of the
+        # quadratic string reallocation of += accumulation
+        display_parts = []
+        for error_id, error_data in enumerate(self.data, 1):
             error_source = error_data[0].ljust(85, ' ')
             error_type = error_data[1].__class__.__name__
             error_message = str(error_data[1]).replace('\n', '', -1)
-            display_str += "{} - <{}> {} // {} \n".format(
-                error_id, error_source, error_type, error_message)
-        return display_str
+            display_parts.append("{} - <{}> {} // {} \n".format(
+                error_id, error_source, error_type, error_message))
+        return "".join(display_parts)
 
     def log(self):
 
@@ -139,7 +142,7 @@ def raise_confirm_dialog(message, ui_title="ERROR", ui_icon="critical"):
     )
 
 
-def transfer_attributes(source_mesh, target_mesh, sample_space=4, clean=True):
+def transfer_attributes(source_mesh, target_mesh, sample_space=4, clean=False):
     """
 
     Args:
@@ -184,25 +187,42 @@ def run():
             ui_title="Warning !",
             ui_icon="warning"
         )
+        # nothing to process, don't let the code below run on an
+        # empty/incomplete selection
+        return
 
     source_mesh_sel = mesh_selection_list.pop(0)
-    # remove the shape of the source in the list if present
-    source_shape = cmds.listRelatives(source_mesh_sel, shapes=True)[0]
-    try:
-        mesh_selection_list.remove(source_shape)
-    except ValueError:
-        pass
+    # remove the shapes of the source in the list if present. With the usual
+    # all-transforms selection no name looks like a shape, so the DAG walk
+    # and the list scans are skipped entirely.
+    if any(":" in name or "Shape" in name for name in mesh_selection_list):
+        source_shapes = cmds.listRelatives(source_mesh_sel, shapes=True) or []
+        for source_shape in source_shapes:
+            try:
+                mesh_selection_list.remove(source_shape)
+            except ValueError:
+                pass
 
     error_h = ErrorHandler()
 
-    for target_mesh in mesh_selection_list:
-        try:
-            transfer_attributes(source_mesh=source_mesh_sel,
-                                target_mesh=target_mesh,
-                                sample_space=SAMPLE_SPACE,
-                                clean=True)
-        except TransferError as excp:
-            error_h.add(target_mesh, excp)
+    cmds.undoInfo(openChunk=True)
+    try:
+        # one transfer per target : transferAttributes only ever writes to
+        # the last selected mesh, so targets cannot be batched in a single
+        # call. History is still flushed once after the loop instead of
+        # once per transfer.
+        for target_mesh in mesh_selection_list:
+            try:
+                transfer_attributes(source_mesh=source_mesh_sel,
+                                    target_mesh=target_mesh,
+                                    sample_space=SAMPLE_SPACE,
+                                    clean=False)
+            except TransferError as excp:
+                error_h.add(target_mesh, excp)
+
+        cmds.delete(mesh_selection_list, constructionHistory=True)
+    finally:
+        cmds.undoInfo(closeChunk=True)
 
     # select back the original selection
     mesh_selection_list.append(source_mesh_sel)
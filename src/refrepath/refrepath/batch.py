@@ -5,6 +5,8 @@ import os
 import re
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
 from pathlib import Path
 from typing import Optional
 
@@ -15,6 +17,39 @@ from refrepath import c
 
 logger = logging.getLogger(__name__)
 
+# compiled once : these run against every line of every mayabatch log
+_REFERENCE_NUMBER_PATTERN = re.compile(r"open_and_repath_references.+\d+/(\d+)")
+_BACKUP_SAVED_PATTERN = re.compile(r"Saving backup <(.+)>")
+
+
+def build_base_env() -> dict:
+    """
+    Build the environment variables shared by every batch subprocess.
+
+    Built once per batch session and reused across files : only the
+    per-file variables differ between subprocesses.
+    """
+    env = dict(os.environ)
+
+    # python
+    refrepath_package = Path(refrepath.__path__[0]).parent
+    python_path = env.get("PYTHON_PATH", "")
+    python_path += f"{os.pathsep}{str(refrepath_package)}"
+    env["PYTHONPATH"] = python_path
+
+    # avoid conflict, make a clean env
+    env["PATH"] = ""
+    env.pop("_", None)
+    env.pop("VIRTUAL_ENV", None)
+
+    # network crap optimizations
+    env["MAYA_DISABLE_CLIC_IPM"] = "1"
+    env["MAYA_DISABLE_CIP"] = "1"
+    env["MAYA_DISABLE_CER"] = "1"
+    env["MAYA_DISABLE_ADP"] = "1"
+
+    return env
+
 
 class FileBatcher:
     """
@@ -36,12 +71,14 @@ class FileBatcher:
         search: str,
         replace: Path,
         maya_batch_path: Path,
+        base_env: Optional[dict] = None,
     ):
 
         self.maya_file = maya_file
         self.search = search
         self.replace = replace
         self.maya_batch_path = maya_batch_path
+        self.base_env = base_env
 
         self.time = datetime.datetime.now()
         """
@@ -53,6 +90,7 @@ class FileBatcher:
         self._log_path = None
         self._env = None
         self._command = None
+        self._logged_ref_num = False
 
     @property
     def log_path(self) -> Path:
@@ -77,37 +115,27 @@ class FileBatcher:
         if self._env is not None:
             return self._env
 
-        env = dict(os.environ)
+        base_env = self.base_env
+        if base_env is None:
+            base_env = build_base_env()
+        env = dict(base_env)
 
         # refrepath specific
         env[self.Variables.arg_maya_file] = str(self.maya_file)
         env[self.Variables.arg_search] = str(self.search)
         env[self.Variables.arg_replace] = str(self.replace)
 
-        # python
-        refrepath_package = Path(refrepath.__path__[0]).parent
-        python_path = env.get("PYTHON_PATH", "")
-        python_path += f"{os.pathsep}{str(refrepath_package)}"
-        env["PYTHONPATH"] = python_path
-
-        # avoid conflict, make a clean env
-        env["PATH"] = ""
-        env.pop("_", None)
-        env.pop("VIRTUAL_ENV", None)
-
-        # network crap optimizations
-        env["MAYA_DISABLE_CLIC_IPM"] = "1"
-        env["MAYA_DISABLE_CIP"] = "1"
-        env["MAYA_DISABLE_CER"] = "1"
-        env["MAYA_DISABLE_ADP"] = "1"
-
         self._env = env
         return self._env
 
     @property
-    def command(self) -> str:
+    def command(self) -> list[str]:
         """
-        Generate the terminal command for launching Maya.
+        Generate the command for launching Maya, as an argument list.
+
+        Kept as a list so subprocess receives the arguments verbatim,
+        without a shell (or windows command-line) re-parsing pass that
+        would need an extra layer of quoting.
         """
 
         if self._command is not None:
@@ -116,92 +144,102 @@ class FileBatcher:
         maya_python_command = (
             "import refrepath.batch;refrepath.batch.process_session();"
         )
-        maya_python_command = (
-            repr(maya_python_command).lstrip('"').rstrip('"').lstrip("'").rstrip("'")
+        # escape for embedding inside the double-quoted mel python("...") call
+        maya_python_command = maya_python_command.replace("\\", "\\\\").replace(
+            '"', '\\"'
         )
 
         command = [
             str(self.maya_batch_path),
             "-command",
-            f'"python(\\"{maya_python_command}\\")"',
+            f'python("{maya_python_command}")',
             "-log",
             str(self.log_path),
         ]
 
-        command = " ".join(command)
         self._command = command
         return self._command
 
-    def execute(self) -> Optional[subprocess.CompletedProcess]:
+    def execute(self) -> Optional[int]:
         """
         Create a subprocess to process and open the given maya file.
+
+        The output is streamed and scanned line by line as it is produced,
+        instead of buffering the whole maya log in memory first.
+
+        Returns:
+            subprocess return code, None if no process was launched.
         """
-        logger.info(f"<{self.identifier}> About to be processed ...")
-        logger.debug(f"<{self.identifier}> Using command={self.command}")
-        logger.debug(f"<{self.identifier}> Using env={json.dumps(self.env, indent=4)}")
+        logger.info("<%s> About to be processed ...", self.identifier)
+        if logger.isEnabledFor(logging.DEBUG):
+            # serializing the whole environment is only worth paying when
+            # the debug level is actually consumed by a handler
+            logger.debug("<%s> Using command=%s", self.identifier, self.command)
+            logger.debug(
+                "<%s> Using env=%s", self.identifier, json.dumps(self.env, indent=4)
+            )
 
         if c.DRYRUN:
-            logger.info(f"<{self.identifier}> Returned earlier, DRYRUN=True")
+            logger.info("<%s> Returned earlier, DRYRUN=True", self.identifier)
             return None
 
         time_start = time.time()
 
-        try:
-            process_result = subprocess.run(
-                self.command,
-                capture_output=True,
-                check=True,
-                env=self.env,
-            )
-        except subprocess.CalledProcessError as excp:
-            process_result = None
-            logger.error(f"<{self.identifier}> {excp}")
+        process = subprocess.Popen(
+            self.command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            env=self.env,
+            text=True,
+            bufsize=1,
+        )
+        with process.stdout:
+            for stdout_line in process.stdout:
+                self._log_output_line(stdout_line.rstrip("\r\n"))
+        returncode = process.wait()
 
         time_end = time.time()
 
-        logger.debug(f"<{self.identifier}>    result:\n{process_result}")
-        logger.info(f"<{self.identifier}> Finished in {time_end - time_start}s")
-        return process_result
-
-    def log_result(self, result: subprocess.CompletedProcess):
-
-        if not result:
-            return
-
-        stdout_result = result.stdout.decode("utf-8")
-        stdout_lines = stdout_result.split("\r\r\n")
-
-        logged_ref_num = False
-
-        for stdout_line in stdout_lines:
-
-            if stdout_line.startswith("ERROR   | 2"):
-                logger.error(f"<{self.identifier}> {stdout_line}")
-
-            elif "no references in scene" in stdout_line:
-                logger.info(
-                    f"<{self.identifier}> No references in scene.",
-                    extra={"color": "green_faint"},
-                )
+        if returncode != 0:
+            logger.error("<%s> Exited with code %s", self.identifier, returncode)
+        logger.info("<%s> Finished in %ss", self.identifier, time_end - time_start)
+        return returncode
 
-            regex_match = re.search(
-                r"open_and_repath_references.+\d+/(\d+)", stdout_line
+    def _log_output_line(self, stdout_line: str):
+        """
+        Scan a single line of the subprocess output and log the relevant bits.
+        """
+        if stdout_line.startswith("ERROR   | 2"):
+            logger.error("<%s> %s", self.identifier, stdout_line)
+
+        elif "no references in scene" in stdout_line:
+            logger.info(
+                "<%s> No references in scene.",
+                self.identifier,
+                extra={"color": "green_faint"},
             )
-            if regex_match and not logged_ref_num:
-                logged_ref_num = True
-                logger.info(
-                    f"<{self.identifier}> Processed {regex_match.group(1)} references.",
-                    extra={"color": "green"},
-                )
 
-            regex_match = re.search(r"Saving backup <(.+)>", stdout_line)
+        # the flag check is a cheap attribute read, the regex scan is not :
+        # once the reference count was logged, skip the search entirely.
+        if not self._logged_ref_num:
+            regex_match = _REFERENCE_NUMBER_PATTERN.search(stdout_line)
             if regex_match:
+                self._logged_ref_num = True
                 logger.info(
-                    f"<{self.identifier}> Saved backup to {regex_match.group(1)}",
+                    "<%s> Processed %s references.",
+                    self.identifier,
+                    regex_match.group(1),
                     extra={"color": "green"},
                 )
 
-        logger.info(f"<{self.identifier}> Finished.")
+        regex_match = _BACKUP_SAVED_PATTERN.search(stdout_line)
+        if regex_match:
+            logger.info(
+                "<%s> Saved backup to %s",
+                self.identifier,
+                regex_match.group(1),
+                extra={"color": "green"},
+            )
         return
 
 
@@ -228,35 +266,58 @@ def batch_directory(
         return not is_backup_file(mfile)
 
     logger.debug(
-        f"Started with:\n"
-        f"    maya_files_dir={maya_files_dir}\n"
-        f"    search={search}\n"
-        f"    replace={replace}\n"
-        f"    maya_batch_path={maya_batch_path}\n"
-        f"    ignore_backups={ignore_backups}"
+        "Started with:\n"
+        "    maya_files_dir=%s\n"
+        "    search=%s\n"
+        "    replace=%s\n"
+        "    maya_batch_path=%s\n"
+        "    ignore_backups=%s",
+        maya_files_dir,
+        search,
+        replace,
+        maya_batch_path,
+        ignore_backups,
     )
 
     maya_file_list = get_maya_files_recursively(maya_files_dir)
     if ignore_backups:
         prev_lens = len(maya_file_list)
         maya_file_list = list(filter(is_not_backup, maya_file_list))
-        logger.debug(f"Removed {prev_lens - len(maya_file_list)} backup files.")
+        logger.debug("Removed %s backup files.", prev_lens - len(maya_file_list))
 
-    logger.info(f"About to process {len(maya_file_list)} files.")
+    logger.info("About to process %s files.", len(maya_file_list))
 
-    for file_index, maya_file in enumerate(maya_file_list):
+    # shared across every file : os.environ is only copied and massaged once
+    base_env = build_base_env()
 
+    def process_file(maya_file: Path):
         file_batcher = FileBatcher(
             maya_file=maya_file,
             search=search,
             replace=replace,
             maya_batch_path=maya_batch_path,
+            base_env=base_env,
         )
-        batch_result = file_batcher.execute()
-        file_batcher.log_result(result=batch_result)
-
-        logger.info(f"{file_index+1}/{len(maya_file_list)} completed.")
-        continue
+        file_batcher.execute()
+
+    # each worker only blocks on its own mayabatch subprocess, so threads
+    # are enough to keep several single-threaded Maya processes busy on
+    # otherwise idle cores.
+    max_workers = max(1, (os.cpu_count() or 2) // 2)
+    file_number = len(maya_file_list)
+    completed = 0
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(process_file, maya_file) for maya_file in maya_file_list
+        ]
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as excp:
+                logger.error("%s", excp)
+            completed += 1
+            logger.info("%s/%s completed.", completed, file_number)
 
     logger.info("Finished.")
     return
@@ -11,6 +11,7 @@ import argparse
 import datetime
 import fnmatch
 import logging
+import logging.handlers
 import os
 import re
 import sys
@@ -53,7 +54,14 @@ def configure_logging(root_path: Path, level: int):
     disk_handler = logging.FileHandler(root_path / disk_handler_filename)
     disk_handler.setLevel(logging.DEBUG)
     disk_handler.setFormatter(formatter)
-    root_logger.addHandler(disk_handler)
+    # buffered: one disk write per 64 records instead of a synchronous
+    # write+flush per record. ERROR and above still flush immediately.
+    buffered_disk_handler = logging.handlers.MemoryHandler(
+        capacity=64,
+        flushLevel=logging.ERROR,
+        target=disk_handler,
+    )
+    root_logger.addHandler(buffered_disk_handler)
     return
 
 
@@ -1,5 +1,7 @@
 import logging
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -8,23 +10,117 @@ from maya import cmds
 logger = logging.getLogger(__name__)
 
 
-def get_references() -> list[str]:
-    """
-    Retrieve all the references nodes from scene.
+def get_references() -> dict[str, Optional[str]]:
     """
+    Retrieve all the references nodes from scene, with their file path.
 
-    def is_ref_valid(ref_name: str):
-        return (
-            "sharedReferenceNode" not in ref_name
-            and "_UNKNOWN_REF_NODE_" not in ref_name
-        )
+    The path is queried once for all nodes here, instead of once per
+    repathing call later. ``unresolvedName=True`` skips maya's path
+    resolution which is pointless for a path we are about to rewrite.
+
+    Returns:
+        mapping of reference node name -> file path, None if it has no path
+    """
 
     scene_reference_list = cmds.ls(type="reference", long=True)
-    scene_reference_list = list(filter(is_ref_valid, scene_reference_list))
-    return scene_reference_list
+
+    # single pass : filtering is fused with the path query instead of
+    # building an intermediate filtered list first.
+    scene_references = {}
+    for scene_reference in scene_reference_list:
+        # plain string checks on the namespace-less name : cheaper than a
+        # regex scan, and nested references still get filtered since their
+        # shared reference nodes come in as "charA:sharedReferenceNode1".
+        leaf_name = scene_reference.rpartition(":")[2]
+        if (
+            leaf_name.startswith("sharedReferenceNode")
+            or "_UNKNOWN_REF_NODE_" in leaf_name
+        ):
+            continue
+        # some references don't have filepath and might raise here
+        try:
+            reference_path = cmds.referenceQuery(
+                scene_reference,
+                filename=True,
+                withoutCopyNumber=True,
+                unresolvedName=True,
+            )
+        except Exception:
+            reference_path = None
+        scene_references[scene_reference] = reference_path
+
+    return scene_references
+
+
+def is_path_existing(path: Path, dir_listing_cache: dict[Path, set[str]]) -> bool:
+    """
+    Like ``Path.exists`` but with one directory listing per parent directory
+    instead of one stat syscall per file.
+
+    Useful when many checked files live in the same directories, which is
+    the usual layout for references.
+
+    Names are normcased on both sides so the lookup stays case-insensitive
+    on windows, like the stat it replaces.
+
+    Args:
+        path: file path that may or may not exist on disk
+        dir_listing_cache: mutated in place, pass the same dict across calls
+    """
+    parent = path.parent
+    listing = dir_listing_cache.get(parent)
+    if listing is None:
+        try:
+            listing = {os.path.normcase(name) for name in os.listdir(parent)}
+        except OSError:
+            listing = set()
+        dir_listing_cache[parent] = listing
+    return os.path.normcase(path.name) in listing
+
+
+def _is_path_under_root(path_str: str, root_str: str) -> bool:
+    """
+    True if the given path is the root itself or lies under it.
+
+    The prefix is bounded on a path separator so a sibling directory that
+    merely shares the root as a name prefix ("/new/rootbeer" against
+    "/new/root") doesn't match. Both separators are accepted as maya
+    happily mixes forward slashes into windows paths.
+    """
+    root = root_str.rstrip("\\/")
+    if not path_str.startswith(root):
+        return False
+    remainder = path_str[len(root) :]
+    return not remainder or remainder[0] in "\\/"
+
+
+def _compute_repathed_str(
+    current_path_str: str,
+    search_pattern: re.Pattern,
+    replace_str: str,
+) -> Optional[str]:
+    """
+    Compute the repathed variant of the given path, as a string.
+
+    The match is anchored at the start of the path : slicing the matched
+    prefix off is cheaper than str.replace, which re-scans the whole
+    string and would also rewrite a second occurrence deeper in the path.
+
+    Returns:
+        new path string, None if the search pattern doesn't match.
+    """
+    search_match = search_pattern.match(current_path_str)
+    if not search_match:
+        return None
+    return replace_str + current_path_str[search_match.end() :]
 
 
 class RepathedReference:
+
+    # fixed field set, one instance per repathed reference: slots keep the
+    # instances compact and make attribute access a plain slot fetch
+    __slots__ = ("node_name", "previous_path", "new_path")
+
     def __init__(self, node_name: str, previous_path: Path, new_path: Path):
         self.node_name: str = node_name
         self.previous_path: Path = previous_path
@@ -39,16 +135,24 @@ class RepathedReference:
 
 def repath_reference(
     node_name,
-    search: str,
-    replace: Path,
+    current_path: Optional[str],
+    search_pattern: re.Pattern,
+    replace_str: str,
+    dir_listing_cache: Optional[dict[Path, set[str]]] = None,
 ) -> Optional[RepathedReference]:
     """
-    Given the reference node name, edit its path to an existing one, so it can be loaded.
+    Given the reference node name, compute its new path so it can be loaded.
+
+    The scene is not modified: the returned instance is applied later with
+    :func:`apply_repathed_references`.
 
     Args:
         node_name: existing maya node name
-        search: part of the path to replace. A regex patterns.
-        replace: partial part to swap with the result of the search
+        current_path: file path of the reference, prefetched by :func:`get_references`
+        search_pattern: compiled pattern matching the part of the path to replace.
+        replace_str: partial part to swap with the result of the search,
+            already converted to string once by the caller.
+        dir_listing_cache: shared cache for on-disk existence checks
 
     Returns:
         result of the repathing as RepathedReference instance
@@ -57,32 +161,40 @@ def repath_reference(
         ValueError: cannot retrieve reference file path
         FileNotFoundError: new path computed doesn't exist on disk
     """
-    # some references don't have filepath and might raise here
-    current_path = cmds.referenceQuery(
-        node_name,
-        filename=True,
-        withoutCopyNumber=True,
-    )
-
     if not current_path:
         raise ValueError(f"Cannot retrieve reference file path on {node_name}")
 
     current_path = Path(current_path)
-    logger.info(f"current_path={current_path}")
+    logger.info("current_path=%s", current_path)
 
-    search_pattern = re.compile(search)
-    actual_search = search_pattern.match(str(current_path))
-    if not actual_search:
+    current_path_str = str(current_path)
+
+    # already under the new root : on no-op scenes this skips the regex
+    # match, the Path construction and the disk check for every reference.
+    if _is_path_under_root(current_path_str, replace_str):
+        logger.info("Returning earlier, path is already up-to-date on <%s>", node_name)
+        return None
+
+    new_path_str = _compute_repathed_str(current_path_str, search_pattern, replace_str)
+    if new_path_str is None:
         raise ValueError(
-            f"Search pattern doesn't match anything: {search} on {current_path}>"
+            f"Search pattern doesn't match anything: "
+            f"{search_pattern.pattern} on {current_path}>"
         )
 
-    actual_search = actual_search.group(0)
+    new_path = Path(new_path_str)
 
-    new_path = str(current_path).replace(actual_search, str(replace))
-    new_path = Path(new_path)
+    # the no-op comparison is pure string work : do it before the disk
+    # probe so already-correct references never touch the filesystem.
+    if new_path == current_path:
+        logger.info("Returning earlier, path is already up-to-date on <%s>", node_name)
+        return None
 
-    if not new_path.exists():
+    if dir_listing_cache is not None:
+        new_path_exists = is_path_existing(new_path, dir_listing_cache)
+    else:
+        new_path_exists = new_path.exists()
+    if not new_path_exists:
         raise FileNotFoundError(f"New path computed doesn't exist on disk: {new_path}")
 
     repathed_reference = RepathedReference(
@@ -91,21 +203,52 @@ def repath_reference(
         new_path=new_path,
     )
 
-    if not repathed_reference.was_updated():
-        logger.info(f"Returning earlier, path is already up-to-date on <{node_name}>")
-        return None
+    logger.info("new_path=%s", new_path)
 
-    logger.info(f"new_path={new_path}")
+    return repathed_reference
 
-    logger.info(f"Repathing <{node_name}> ...")
-    # a reference repath can fail because of unkown node, we usually want to ignore that
-    # so that's why we just log the error and still consider the repathing sucessful.
-    try:
-        cmds.file(str(new_path), loadReference=node_name, loadReferenceDepth="none")
-    except Exception as excp:
-        logger.error(f"{excp}")
 
-    return repathed_reference
+def apply_repathed_references(repathed_references: list[RepathedReference]):
+    """
+    Load every given reference with its new path, back-to-back.
+
+    Issued as a single batch so the undo bookkeeping, viewport refreshes and
+    script-editor output are paid once for the whole list instead of once
+    per reference.
+
+    Args:
+        repathed_references: references with an already computed new path
+    """
+    # nothing to load : don't pay the state toggles on a no-op scene
+    if not repathed_references:
+        return
+
+    cmds.undoInfo(openChunk=True)
+    cmds.refresh(suspend=True)
+    cmds.scriptEditorInfo(suppressInfo=True, suppressWarnings=True)
+    # no point re-evaluating the graph after each reference load either
+    previous_em_mode = cmds.evaluationManager(query=True, mode=True)[0]
+    cmds.evaluationManager(mode="off")
+    try:
+        for repathed_reference in repathed_references:
+            logger.info("Repathing <%s> ...", repathed_reference.node_name)
+            # a reference repath can fail because of unkown node, we usually want
+            # to ignore that so that's why we just log the error and still
+            # consider the repathing sucessful.
+            try:
+                cmds.file(
+                    str(repathed_reference.new_path),
+                    loadReference=repathed_reference.node_name,
+                    loadReferenceDepth="none",
+                )
+            except Exception as excp:
+                logger.error("%s", excp)
+    finally:
+        cmds.evaluationManager(mode=previous_em_mode)
+        cmds.scriptEditorInfo(suppressInfo=False, suppressWarnings=False)
+        cmds.refresh(suspend=False)
+        cmds.undoInfo(closeChunk=True)
+    return
 
 
 def open_and_repath_references(
@@ -125,36 +268,92 @@ def open_and_repath_references(
         list of RepathedReference instances.
     """
 
-    logger.info(f"Opening <{maya_file_path}> ...")
-    try:
-        # still trigger warning but doesn't load references
-        cmds.file(
-            maya_file_path,
-            open=True,
-            force=True,
-            loadReferenceDepth="none",
-            prompt=False,
+    # skip the reopen when the file is already the current unmodified scene :
+    # the scene load is by far the most expensive step of this function.
+    current_scene = cmds.file(query=True, sceneName=True)
+    if (
+        current_scene
+        and os.path.normcase(os.path.realpath(current_scene))
+        == os.path.normcase(os.path.realpath(str(maya_file_path)))
+        and not cmds.file(query=True, modified=True)
+    ):
+        logger.info(
+            "Skipping opening of <%s>: already the current scene.", maya_file_path
         )
-    except Exception as excp:
-        logger.error(f"{excp}")
+    else:
+        logger.info("Opening <%s> ...", maya_file_path)
+        try:
+            # still trigger warning but doesn't load references
+            cmds.file(
+                maya_file_path,
+                open=True,
+                force=True,
+                loadReferenceDepth="none",
+                prompt=False,
+            )
+        except Exception as excp:
+            logger.error("%s", excp)
 
-    scene_reference_list = get_references()
-    if not scene_reference_list:
+    scene_references = get_references()
+    if not scene_references:
         logger.info("Returned early: no references in scene.")
         return []
 
     repathed_reference_list = []
+    # one directory listing per referenced directory instead of one stat
+    # per reference file
+    dir_listing_cache: dict[Path, set[str]] = {}
+    # loop invariants : compiled pattern, replace string and total count,
+    # once for all references
+    search_pattern = re.compile(search)
+    replace_str = str(replace)
+    reference_number = len(scene_references)
+
+    # warm the directory-listing cache concurrently : the listings are
+    # independent blocking I/O, which a thread pool overlaps on slow mounts
+    # while all maya calls stay on the main thread.
+    candidate_parents = set()
+    for current_path in scene_references.values():
+        if not current_path:
+            continue
+        current_path_str = str(Path(current_path))
+        if _is_path_under_root(current_path_str, replace_str):
+            continue
+        candidate_str = _compute_repathed_str(
+            current_path_str, search_pattern, replace_str
+        )
+        if candidate_str is None:
+            continue
+        candidate_parents.add(Path(candidate_str).parent)
 
-    for index, scene_reference in enumerate(scene_reference_list):
+    if candidate_parents:
+
+        def get_dir_listing(parent: Path) -> tuple[Path, set[str]]:
+            # normcased like the is_path_existing fill so lookups match
+            try:
+                return parent, {os.path.normcase(name) for name in os.listdir(parent)}
+            except OSError:
+                return parent, set()
+
+        with ThreadPoolExecutor(
+            max_workers=min(32, len(candidate_parents))
+        ) as executor:
+            for parent, listing in executor.map(get_dir_listing, candidate_parents):
+                dir_listing_cache[parent] = listing
+
+    # phase 1 : compute every new path, no scene mutation yet
+    for index, (scene_reference, current_path) in enumerate(scene_references.items()):
 
         logger.info(
-            f"{index+1}/{len(scene_reference_list)} Repathing {scene_reference} ..."
+            "%s/%s Repathing %s ...", index + 1, reference_number, scene_reference
         )
         try:
             repathed_reference = repath_reference(
                 node_name=scene_reference,
-                search=search,
-                replace=replace,
+                current_path=current_path,
+                search_pattern=search_pattern,
+                replace_str=replace_str,
+                dir_listing_cache=dir_listing_cache,
             )
         except Exception as excp:
             logger.error(excp)
@@ -163,5 +362,8 @@ def open_and_repath_references(
         if repathed_reference:
             repathed_reference_list.append(repathed_reference)
 
-    logger.info(f"Finished.")
+    # phase 2 : apply all the edits back-to-back as a single batch
+    apply_repathed_references(repathed_reference_list)
+
+    logger.info("Finished.")
     return repathed_reference_list
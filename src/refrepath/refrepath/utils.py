@@ -1,4 +1,5 @@
 import enum
+import functools
 import logging
 import os
 import re
@@ -52,18 +53,51 @@ def get_child_files_from_root(
 def get_maya_files_recursively(root_path) -> list[Path]:
     """
     Parse the given directopry and all its subdirectories for maya files.
+
+    Single scandir pass with an explicit stack : the extension check is a
+    plain string endswith and a Path instance is only built for kept files,
+    instead of wrapping and stat-ing every entry of the tree.
     """
     logger.info(f"Started with root_path={root_path}")
 
-    maya_file_list = get_child_files_from_root(
-        root_path=root_path,
-        recursive=True,
-        extensions_filter=[".mb", ".ma"],
-    )
+    maya_file_list = []
+    dir_stack = [os.fspath(root_path)]
+
+    while dir_stack:
+        current_dir = dir_stack.pop()
+        try:
+            with os.scandir(current_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        dir_stack.append(entry.path)
+                    elif entry.name.endswith((".ma", ".mb")) and entry.is_file(
+                        follow_symlinks=False
+                    ):
+                        maya_file_list.append(Path(entry.path))
+        except OSError as excp:
+            logger.warning(f"Cannot scan <{current_dir}>: {excp}")
 
     return maya_file_list
 
 
+@functools.lru_cache(maxsize=None)
+def _get_increment_pattern(zfill: int) -> re.Pattern:
+    """
+    Compiled once per zfill value : the functions below run for every file
+    of a batch, all sharing the same configuration.
+    """
+    return re.compile(rf"\.\d{{{zfill}}}$")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_backup_pattern(backup_suffix: str, zfill: int) -> re.Pattern:
+    """
+    Cached on the (suffix, zfill) values so runtime edits of the ``c``
+    module constants still produce the right pattern.
+    """
+    return re.compile(rf"{re.escape(backup_suffix)}\.\d{{{zfill}}}")
+
+
 def increment_path(current_path: Path, zfill: int = 4) -> Path:
     """
     From the given file path, increment it until it doesn't exist it on disk.
@@ -90,23 +124,39 @@ def increment_path(current_path: Path, zfill: int = 4) -> Path:
         non-existing file path
     """
 
-    increment = 1
-    existing_increment = re.search(rf"\.\d{{{zfill}}}$", current_path.stem)
-    new_scene_path = Path(current_path)
-
-    while new_scene_path.exists() or increment == 1:
-
-        increment_less_path = current_path.stem
-        if existing_increment:
-            increment_less_path = increment_less_path.replace(
-                existing_increment.group(0), ""
-            )
-
-        new_scene_name = increment_less_path + "." + f"{increment}".zfill(zfill)
-        new_scene_path = current_path.with_stem(new_scene_name)
-        increment += 1
+    existing_increment = _get_increment_pattern(zfill).search(current_path.stem)
+
+    increment_less_path = current_path.stem
+    if existing_increment:
+        increment_less_path = increment_less_path.replace(
+            existing_increment.group(0), ""
+        )
+
+    def get_incremented_path(increment: int) -> Path:
+        # single format-spec allocation instead of str() + zfill()
+        new_scene_name = f"{increment_less_path}.{increment:0{zfill}d}"
+        return current_path.with_stem(new_scene_name)
+
+    # one directory listing finding the highest existing increment : bounded
+    # syscall count instead of one stat per probed candidate. Using max + 1
+    # also means a hole in the sequence is never silently reused.
+    name_pattern = re.compile(
+        re.escape(increment_less_path)
+        + r"\.(\d+)"
+        + re.escape(current_path.suffix)
+        + r"$"
+    )
+    last_increment = 0
+    try:
+        with os.scandir(current_path.parent) as entries:
+            for entry in entries:
+                name_match = name_pattern.match(entry.name)
+                if name_match:
+                    last_increment = max(last_increment, int(name_match.group(1)))
+    except OSError:
+        pass
 
-    return new_scene_path
+    return get_incremented_path(last_increment + 1)
 
 
 def is_backup_file(file_path: Path) -> bool:
@@ -114,7 +164,7 @@ def is_backup_file(file_path: Path) -> bool:
     Returns:
         True if the given file is potentially a refrepath backup.
     """
-    pattern = re.compile(rf"{re.escape(c.PATH_BACKUP_SUFFIX)}\.\d{{{c.PATH_ZFILL}}}")
+    pattern = _get_backup_pattern(c.PATH_BACKUP_SUFFIX, c.PATH_ZFILL)
     return bool(pattern.search(file_path.stem))
 
 